@@ -1,9 +1,4 @@
 from HeatPumpStudy import HeatPumpStudy, alternate
-from tespy.components import (Valve, Sink, Source, Pump, Compressor,
-                              HeatExchanger, Turbine, CycleCloser, HeatExchangerSimple)
-from tespy.connections import Connection
-from tespy.networks import Network
-from CoolProp.CoolProp import PropsSI as PSI
 
 
 class InternalCondenserHeatPumpStudy(HeatPumpStudy):
@@ -11,6 +6,8 @@ class InternalCondenserHeatPumpStudy(HeatPumpStudy):
         super().__init__(**kwargs)
         
     def setup_network(self, iterinfo=False):
+        from tespy.networks import Network
+
         self.comp = {}
         self.conn = {}
         self.network = Network(fluids=[self.working_fluid, "water"], iterinfo=iterinfo)
@@ -25,6 +22,9 @@ class InternalCondenserHeatPumpStudy(HeatPumpStudy):
 
 
     def setup_components_and_connections(self):
+        from tespy.components import (Valve, Pump, Compressor,
+                                      HeatExchanger, Turbine, CycleCloser, HeatExchangerSimple)
+
         N = self.N
         expansion_type = Valve
         if self.expansion_device == "expander":
@@ -73,6 +73,7 @@ class InternalCondenserHeatPumpStudy(HeatPumpStudy):
         # self.add_condenser_cooling()# need to change condenser type to Condenser when used and HeatExchangerSimple when not used
 
     def set_boundary_conditions(self, T_cond=80, T_evap=-10, T_consumer=60):
+        from CoolProp.CoolProp import PropsSI as PSI
 
         # Todo: make work with N > 1
 
@@ -123,6 +124,8 @@ class InternalCondenserHeatPumpStudy(HeatPumpStudy):
 
 
     def get_results(self):
+        from tespy.components import CycleCloser
+
         return {
             comp.label: comp.get_plotting_data()[1]
             for comp in self.comp.values()
@@ -130,6 +133,8 @@ class InternalCondenserHeatPumpStudy(HeatPumpStudy):
         }
     
     def calculate_cop(self):
+        from tespy.components import Compressor, Turbine
+
         Q = abs(self.comp["consumer"].Q.val)
         W = sum(
             comp.P.val for comp in self.comp.values() if isinstance(comp, (Compressor, Turbine))
@@ -1,7 +1,4 @@
 from HeatPumpStudy import HeatPumpStudy
-from tespy.components import (Valve, Sink, Source, Pump, Compressor, Condenser, Turbine, CycleCloser, HeatExchangerSimple)
-from tespy.connections import Connection
-from CoolProp.CoolProp import PropsSI as PSI
 
 class RegularHeatPumpStudy(HeatPumpStudy):
     def __init__(self, **kwargs):
@@ -9,6 +6,8 @@ class RegularHeatPumpStudy(HeatPumpStudy):
 
 
     def setup_components_and_connections(self):
+        from tespy.components import (Valve, Compressor, Turbine, CycleCloser, HeatExchangerSimple)
+
         expansion_type = Valve
         if self.expansion_device == "expander":
             expansion_type = Turbine
@@ -35,6 +34,7 @@ class RegularHeatPumpStudy(HeatPumpStudy):
 
 
     def set_boundary_conditions(self, T_cond=80, T_evap=20):
+        from CoolProp.CoolProp import PropsSI as PSI
 
         p_cond = PSI("P", "Q", 0, "T", 273.15 + T_cond, self.working_fluid) / 1e5
         p_evap = PSI("P", "Q", 1, "T", 273.15 + T_evap, self.working_fluid) / 1e5
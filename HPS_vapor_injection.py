@@ -1,18 +1,5 @@
 import numpy as np
 from HeatPumpStudy import HeatPumpStudy, alternate
-from tespy.components import (
-    Valve,
-    Compressor,
-    Splitter,
-    Merge,
-    HeatExchanger,
-    Turbine,
-    CycleCloser,
-    HeatExchangerSimple,
-)
-
-
-from CoolProp.CoolProp import PropsSI as PSI
 
 
 class VaporInjectionHeatPumpStudy(HeatPumpStudy):
@@ -20,6 +7,16 @@ class VaporInjectionHeatPumpStudy(HeatPumpStudy):
         super().__init__(**kwargs)
 
     def setup_components_and_connections(self):
+        from tespy.components import (
+            Valve,
+            Compressor,
+            Splitter,
+            Merge,
+            Turbine,
+            CycleCloser,
+            HeatExchangerSimple,
+        )
+
         N = self.N
         expansion_type = Valve
         if self.expansion_device == "expander":
@@ -65,6 +62,7 @@ class VaporInjectionHeatPumpStudy(HeatPumpStudy):
 
     
     def set_boundary_conditions(self, T_cond=80, T_evap=-10):
+        from CoolProp.CoolProp import PropsSI as PSI
 
         p_cond = PSI("P", "Q", 0, "T", 273.15 + T_cond, self.working_fluid) / 1e5
         p_evap = PSI("P", "Q", 1, "T", 273.15 + T_evap, self.working_fluid) / 1e5
@@ -127,6 +125,8 @@ class VaporInjectionHeatPumpStudy(HeatPumpStudy):
 
 
     def get_results(self):
+        from tespy.components import HeatExchanger, Merge, CycleCloser, Splitter
+
         results = {}
         for comp in self.comp.values():
             
@@ -1,25 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tespy.components import (
-    Valve,
-    Sink,
-    Source,
-    Pump,
-    Compressor,
-    Merge,
-    Splitter,
-    Condenser,
-    Turbine,
-    CycleCloser,
-    HeatExchangerSimple,
-    HeatExchanger,
-)
-from tespy.components.component import Component
-from tespy.connections import Connection
-from tespy.networks import Network
-from CoolProp.CoolProp import PropsSI as PSI
-from typing import Dict
-import inspect
+from typing import Dict, TYPE_CHECKING
+
+# TESPy, CoolProp, matplotlib and fluprodia are imported inside the methods that
+# need them, so importing a study module stays cheap (e.g. in process-pool
+# workers that only compute COPs). See benchmark_import_time.py.
+if TYPE_CHECKING:
+    from tespy.components.component import Component
+    from tespy.connections import Connection
 
 
 class HeatPumpStudy:
@@ -38,12 +25,14 @@ class HeatPumpStudy:
         self.compressor_efficiency = compressor_efficiency
         self.expander_efficiency = expander_efficiency
         self.expansion_device = expansion_device
-        self.comp: Dict[str, Component] = {}
-        self.conn: Dict[str, Connection] = {}
+        self.comp: Dict[str, "Component"] = {}
+        self.conn: Dict[str, "Connection"] = {}
         self.network = None
         self.setup_network()
 
     def setup_network(self, iterinfo=False):
+        from tespy.networks import Network
+
         self.comp = {}
         self.conn = {}
         self.network = Network(fluids=[self.working_fluid], iterinfo=iterinfo)
@@ -57,6 +46,8 @@ class HeatPumpStudy:
         return self
 
     def add_components_and_connections(self, component_list, connection_list):
+        from tespy.connections import Connection
+
         for name, comp_class in component_list:
             self.comp[name] = comp_class(name)
 
@@ -88,7 +79,7 @@ class HeatPumpStudy:
         param: type: Component - type of component
     """
 
-    def repeat_comp(self, name: str, type: type[Component], N=-1):
+    def repeat_comp(self, name: str, type: "type[Component]", N=-1):
         if N == -1:
             N = self.N
         return [(f"{name}_{i+1}", type) for i in range(N)]
@@ -129,6 +120,8 @@ class HeatPumpStudy:
 
 
     def add_condenser_cooling(self):
+        from tespy.components import Pump, HeatExchangerSimple, CycleCloser
+
         component_list = [
             # ("condenser", HeatExchanger), TODO: replace simple condenser with normal condenser
             ("consumer_pump", Pump),
@@ -153,6 +146,8 @@ class HeatPumpStudy:
         self.comp["consumer"].set_attr(pr=0.99, Q=-self.Q_out)
 
     def calculate_cop(self, consumer="condenser"):
+        from tespy.components import Compressor, Turbine
+
         Q = abs(self.comp[consumer].Q.val)
         W = sum(
             comp.P.val for comp in self.comp.values() if isinstance(comp, (Compressor, Turbine))
@@ -201,6 +196,8 @@ class HeatPumpStudy:
         return efficiency_matrix
 
     def get_results(self):
+        from tespy.components import HeatExchanger, Merge, CycleCloser, Splitter
+
         results = {}
         for comp in self.comp.values():
             if isinstance(comp, (HeatExchanger, Merge)) and "condenser" not in comp.label :
@@ -267,6 +264,8 @@ class HeatPumpStudy:
         diagram.save(f"{filename}.svg")
 
     def plot_efficiency(self, filename):
+        import matplotlib.pyplot as plt
+
         efficiency_matrix = self.efficiency()
 
         condensation_temps = np.arange(50, 71, 5)
@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+
+# Import-time budget (seconds, best of REPEAT fresh interpreters) for each study
+# entry point. TESPy, CoolProp and the plotting stack must not be loaded on import.
+BUDGET = 0.25
+REPEAT = 5
+ENTRY_POINTS = {
+    "HPS_regular": "RegularHeatPumpStudy",
+    "HPS_vapor_injection": "VaporInjectionHeatPumpStudy",
+    "HPS_multistage_condenser": "InternalCondenserHeatPumpStudy",
+}
+LAZY_MODULES = ["tespy", "CoolProp", "matplotlib", "fluprodia"]
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SNIPPET = """
+import sys, time
+t = time.perf_counter()
+from {module} import {cls}
+t = time.perf_counter() - t
+loaded = [m for m in {lazy!r} if m in sys.modules]
+print(t, ",".join(loaded))
+"""
+
+
+def measure(module, cls):
+    code = SNIPPET.format(module=module, cls=cls, lazy=LAZY_MODULES)
+    times = []
+    loaded = ""
+    for _ in range(REPEAT):
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, cwd=REPO_DIR
+        )
+        if proc.returncode != 0:
+            return None, proc.stderr.strip()
+        out = proc.stdout.split()
+        times.append(float(out[0]))
+        loaded = out[1] if len(out) > 1 else ""
+    return min(times), loaded
+
+
+def main():
+    failed = False
+    for module, cls in ENTRY_POINTS.items():
+        t, loaded = measure(module, cls)
+        if t is None:
+            failed = True
+            print(f"FAIL {module}.{cls}: import failed\n{loaded}")
+            continue
+        ok = t <= BUDGET and not loaded
+        failed |= not ok
+        extra = f" (eagerly loaded: {loaded})" if loaded else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {module}.{cls}: {t*1e3:.1f} ms / {BUDGET*1e3:.0f} ms{extra}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())